@@ -0,0 +1,288 @@
+"""
+Module for date and time parsing, formatting and arithmetic (as_date, as_posixct, strftime, difftime)
+
+Parsing infers a format once from a small sample of values, optionally caches it under a
+caller-supplied key (a column name, file path, ...), then parses every distinct string with that
+fixed format in a single vectorized call. Columns whose values (almost) never repeat are parsed
+directly, since hashing them to find the distinct ones would cost more than it saves.
+Results are compact ``datetime64`` arrays.
+"""
+
+import collections.abc
+import datetime
+import typing
+
+import numpy as np
+import pandas as pd
+
+__all__ = [ # export funtions for import *
+    "as_date",
+    "as_posixct",
+    "strftime",
+    "difftime",
+]
+
+FORMAT_SAMPLE_SIZE = 64 # values checked when inferring a format
+DEDUPE_SAMPLE_SIZE = 4096 # rows checked for repeats before parsing only the distinct strings
+
+# The format parsing the most sampled values wins; formats that tie but read the same string differently
+# (day-first vs month-first) are reported as ambiguous rather than picked by position
+DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%d %H:%M",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d %H:%M",
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%b/%Y:%H:%M:%S %z", # common/combined log format
+    "%a %b %d %H:%M:%S %Y", # ctime / syslog-style
+)
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%d-%b-%Y",
+    "%d %b %Y",
+    "%b %d %Y",
+    "%Y%m%d",
+)
+
+type _Units = typing.Literal["auto", "secs", "mins", "hours", "days", "weeks"]
+
+_UNIT_SECONDS: dict[str, int] = {"secs": 1, "mins": 60, "hours": 3600, "days": 86400, "weeks": 604800}
+_FORMAT_CACHE: dict[collections.abc.Hashable, str] = {}
+
+
+################################################
+#  Format Inference
+################################################
+
+def _parse_sample(fmt: str, sample: list[str]) -> dict[str, datetime.datetime]:
+    """Returns the sampled values fmt can parse, mapped to what it parses them as."""
+    parsed = {}
+    for s in sample:
+        try:
+            parsed[s] = datetime.datetime.strptime(s, fmt)
+        except ValueError:
+            pass
+    return parsed
+
+
+def _sample(values: np.ndarray) -> list[str]:
+    """Returns the strings among an evenly spaced sample of at most FORMAT_SAMPLE_SIZE values."""
+    step = max(len(values) // FORMAT_SAMPLE_SIZE, 1)
+    return [s for s in values[::step][:FORMAT_SAMPLE_SIZE].tolist() if isinstance(s, str)]
+
+
+def _infer_format(sample: list[str], candidates: tuple[str, ...], cached: str | None = None) -> str:
+    """
+    Returns the candidate format that parses the most of the sampled values, or cached if it does as well.
+    Raises ValueError if no candidate parses anything, or if the best ones disagree on a value
+    """
+
+    parsed = {fmt: _parse_sample(fmt, sample) for fmt in candidates}
+    best_count = max(len(p) for p in parsed.values())
+    if best_count == 0:
+        example = sample[0] if sample else None
+        raise ValueError(f"Could not infer a date/time format from values such as {example!r}; please provide format.")
+    if cached is not None and len(_parse_sample(cached, sample)) >= best_count:
+        return cached
+
+    best, *tied = [fmt for fmt in candidates if len(parsed[fmt]) == best_count]
+    for other in tied:
+        # siblings such as %S / %S.%f can tie on mixed input without ever reading a value differently
+        clash = next((s for s, dt in parsed[other].items() if parsed[best].get(s, dt) != dt), None)
+        if clash is not None:
+            raise ValueError(f"Ambiguous date/time format: {clash!r} parses as both {best!r} and {other!r}; "
+                             "please provide format.")
+    return best
+
+
+def _resolve_format(values: np.ndarray, format: str | None, key, candidates: tuple[str, ...]) -> str:
+    """Picks the explicit format, else the one cached under key, else infers (and caches) one."""
+    if format is not None:
+        return format
+    sample = _sample(values)
+    cached = _FORMAT_CACHE.get(key) if key is not None else None
+    if cached is not None and len(_parse_sample(cached, sample)) == len(sample):
+        return cached
+    # nothing cached, or the cached format misses some values: keep it only if no candidate does better
+    fmt = _infer_format(sample, candidates, cached)
+    if key is not None:
+        _FORMAT_CACHE[key] = fmt
+    return fmt
+
+
+def _sibling_format(fmt: str) -> str | None:
+    """Returns fmt with fractional seconds toggled; isoformat() and most loggers omit a zero fraction."""
+    if "%S.%f" in fmt:
+        return fmt.replace("%S.%f", "%S")
+    if "%S" in fmt:
+        return fmt.replace("%S", "%S.%f")
+    return None
+
+
+################################################
+#  Parsing
+################################################
+
+def _compact_unit(parsed: pd.DatetimeIndex) -> str:
+    """Returns "s" if no value carries a sub-second part, otherwise "us"."""
+    values = parsed.to_numpy()
+    present = values[~np.isnat(values)]
+    return "s" if (present.astype("datetime64[s]") == present).all() else "us"
+
+
+def _to_naive_utc(parsed: pd.DatetimeIndex, tz: str | None) -> pd.DatetimeIndex:
+    """Converts aware values to naive UTC, or reads naive values in tz first if one is given."""
+    if parsed.tz is not None:
+        return parsed.tz_convert("UTC").tz_localize(None)
+    if tz is not None:
+        return parsed.tz_localize(tz, ambiguous="NaT", nonexistent="NaT").tz_convert("UTC").tz_localize(None)
+    return parsed
+
+
+def _mostly_unique(values: np.ndarray) -> bool:
+    """True when a random sample of DEDUPE_SAMPLE_SIZE rows has almost no repeated values."""
+    if len(values) <= DEDUPE_SAMPLE_SIZE:
+        return False
+    rows = np.random.default_rng(0).choice(len(values), DEDUPE_SAMPLE_SIZE, replace=False)
+    return DEDUPE_SAMPLE_SIZE - len(pd.unique(values[rows])) <= DEDUPE_SAMPLE_SIZE // 1000
+
+
+def _parse_strings(uniques: np.ndarray, format: str | None, key, tz: str | None,
+                   candidates: tuple[str, ...]) -> pd.DatetimeIndex:
+    """Parses strings with one fixed format, retrying leftovers with its fractional-seconds sibling."""
+    fmt = _resolve_format(uniques, format, key, candidates)
+    # utc=True lets pandas accept mixed offsets, which it otherwise refuses to combine
+    parsed = _to_naive_utc(pd.DatetimeIndex(pd.to_datetime(uniques, format=fmt, errors="coerce", utc="%z" in fmt)), tz)
+    sibling = _sibling_format(fmt)
+    missing = np.asarray(parsed.isna())
+    if sibling is not None and missing.any():
+        retried = pd.to_datetime(uniques[missing], format=sibling, errors="coerce", utc="%z" in fmt)
+        merged = parsed.to_numpy(dtype="datetime64[us]", copy=True)
+        merged[missing] = _to_naive_utc(pd.DatetimeIndex(retried), tz).to_numpy(dtype="datetime64[us]")
+        parsed = pd.DatetimeIndex(merged)
+    return parsed
+
+
+def _parse(x, format: str | None, key, unit: str | None, tz: str | None, candidates: tuple[str, ...]):
+    """Shared implementation for as_date and as_posixct."""
+    values = x.to_numpy() if isinstance(x, pd.Series) else np.asarray(x)
+    values = values.reshape(-1)
+    epoch_unit = "D" if unit == "D" else "s" # R counts days for Dates and seconds for date-times
+
+    if values.dtype.kind == "M":
+        result = values.astype(f"datetime64[{unit or np.datetime_data(values.dtype)[0]}]")
+    elif values.dtype.kind in "iu":
+        result = values.astype(f"datetime64[{epoch_unit}]").astype(f"datetime64[{unit or 's'}]")
+    elif values.dtype.kind == "f":
+        parsed = pd.DatetimeIndex(pd.to_datetime(values, unit=epoch_unit)) # NaN becomes NaT
+        result = parsed.to_numpy(dtype=f"datetime64[{unit or _compact_unit(parsed)}]")
+    elif values.dtype.kind == "O" and pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+        # datetime/date/Timestamp objects, possibly tz-aware: pandas converts these directly
+        parsed = pd.DatetimeIndex(pd.to_datetime(values, utc=True)).tz_localize(None)
+        result = parsed.to_numpy(dtype=f"datetime64[{unit or _compact_unit(parsed)}]")
+    elif _mostly_unique(values):
+        # nothing to gain from deduplicating; factorize alone costs about as much as pandas' ISO parser
+        parsed = _parse_strings(values.astype(object, copy=False), format, key, tz, candidates)
+        result = parsed.to_numpy(dtype=f"datetime64[{unit or _compact_unit(parsed)}]")
+    else:
+        # Timestamp columns usually repeat heavily, so parse each distinct string once and scatter back
+        codes, uniques = pd.factorize(values)
+        uniques = uniques.astype(object) # StringDType cannot be cast to fixed-width str
+        if len(uniques) == 0:
+            result = np.full(len(values), np.datetime64("NaT", unit or "s"))
+        else:
+            parsed = _parse_strings(uniques, format, key, tz, candidates)
+            parsed = parsed.to_numpy(dtype=f"datetime64[{unit or _compact_unit(parsed)}]")
+            result = np.append(parsed, np.datetime64("NaT"))[codes] # code -1 (missing) selects the NaT slot
+
+    if isinstance(x, pd.Series):
+        return pd.Series(result, index=x.index, name=x.name)
+    return result
+
+
+def as_date(x, format: str | None = None, key: collections.abc.Hashable | None = None):
+    """
+    Receives a vector of date strings (or dates/datetimes, or numeric days since 1970-01-01),
+    returns a datetime64[D] array (a Series for Series input, which pandas stores at second resolution);
+    unparseable values become NaT.
+    When format is None it is inferred from a sample, and remembered under key if one is given;
+    ValueError is raised if the sample fits several formats that disagree (e.g. 03/04/2024)
+    """
+
+    return _parse(x, format, key, "D", None, DATE_FORMATS + DATETIME_FORMATS)
+
+
+def as_posixct(x, format: str | None = None, tz: str | None = None,
+               key: collections.abc.Hashable | None = None, unit: str | None = None):
+    """
+    Receives a vector of date-time strings (or datetimes, or numeric seconds since the epoch),
+    returns a datetime64 array in UTC; unparseable values become NaT.
+    Values with an explicit offset or timezone are converted to UTC, other strings are read in tz (UTC if None).
+    The unit defaults to that of datetime64 input, otherwise to seconds, or microseconds when any value
+    carries fractional seconds.
+    Repeated strings are parsed once, which makes log-style formats many times faster than pandas;
+    on all-distinct ISO 8601 strings, which pandas parses natively, expect roughly pandas' own speed
+    """
+
+    return _parse(x, format, key, unit, tz, DATETIME_FORMATS + DATE_FORMATS)
+
+
+################################################
+#  Formatting and Arithmetic
+################################################
+
+def _as_datetimes(x) -> np.ndarray:
+    values = x.to_numpy() if isinstance(x, pd.Series) else np.asarray(x)
+    if values.dtype.kind != "M":
+        values = as_posixct(values)
+    return values.reshape(-1)
+
+
+def strftime(x, format: str = "%Y-%m-%d %H:%M:%S"):
+    """
+    Receives a vector of datetimes (or parseable strings) and a format, returns the formatted strings;
+    NaT becomes a missing value
+    """
+
+    values = _as_datetimes(x)
+    codes, uniques = pd.factorize(values)
+    formatted = pd.DatetimeIndex(uniques).strftime(format).to_numpy(dtype=object)
+    result = np.append(formatted, np.nan)[codes].astype(np.dtypes.StringDType(na_object=np.nan))
+    if isinstance(x, pd.Series):
+        return pd.Series(result, index=x.index, name=x.name)
+    return result
+
+
+def difftime(time1, time2, units: _Units = "auto") -> tuple[np.ndarray, str]:
+    """
+    Receives two vectors of datetimes (or parseable strings), returns (time1 - time2 as floats, units).
+    With units="auto" the largest of secs/mins/hours/days whose smallest non-missing absolute difference
+    is at least 1 is used, as in R
+    """
+
+    # divide in the operands' own unit; casting to ns first would overflow beyond ~292 years
+    seconds = (_as_datetimes(time1) - _as_datetimes(time2)) / np.timedelta64(1, "s")
+
+    if units == "auto":
+        finite = np.abs(seconds[~np.isnan(seconds)])
+        smallest = finite.min() if finite.size else 0.0
+        units = "secs"
+        for candidate in ("mins", "hours", "days"):
+            if smallest >= _UNIT_SECONDS[candidate]:
+                units = candidate
+    elif units not in _UNIT_SECONDS:
+        raise ValueError(f"Unsupported units: {units!r}; expected one of {['auto', *_UNIT_SECONDS]}.")
+
+    values = seconds / _UNIT_SECONDS[units]
+    if isinstance(time1, pd.Series):
+        values = pd.Series(values, index=time1.index, name=time1.name)
+    return values, units
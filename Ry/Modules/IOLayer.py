@@ -8,6 +8,7 @@ import io
 import os
 import pathlib
 import sys
+import threading
 import typing
 from collections.abc import Callable, Hashable, Mapping, Sequence
 
@@ -231,6 +232,9 @@ FILE_HEADER = b"\x93RYDATA"   # Magic number for RyData files
 CURRENT_VERSION = b"\x01\x00" # version 1.0
 MAGIC_NUMBER = FILE_HEADER + CURRENT_VERSION + b"\n"
 
+# Per-thread path of the file most recently written by save(), so instrumentation can attribute its size
+_last_saved = threading.local()
+
 def save(obj: _pd.DataFrame | _pd.Series | _np.ndarray, name: str | None = None) -> None:
     """Saves a pandas DataFrame, Series, or numpy ndarray to disk, optionally in a compressed format if available in the stdlib.
     
@@ -249,6 +253,9 @@ def save(obj: _pd.DataFrame | _pd.Series | _np.ndarray, name: str | None = None)
         frame = inspect.currentframe()
         try:
             caller_frame = frame.f_back if frame is not None else None
+            # wrappers (e.g. Rprof's) mark their frames with a local __ry_transparent__ to be looked through
+            while caller_frame is not None and caller_frame.f_locals.get("__ry_transparent__"):
+                caller_frame = caller_frame.f_back
             if caller_frame is not None:
                 # Search caller's locals first, then globals
                 for scope in (caller_frame.f_locals, caller_frame.f_globals):
@@ -290,7 +297,9 @@ def save(obj: _pd.DataFrame | _pd.Series | _np.ndarray, name: str | None = None)
         
         # Write the buffer to disk with the appropriate compression format
         buf.seek(0)
-        with open(ry_data.joinpath(f"{name}"), "wb") as output_file:
+        path = ry_data.joinpath(f"{name}")
+        _last_saved.path = path
+        with open(path, "wb") as output_file:
             output_file.write(MAGIC_NUMBER)
             output_file.write(dtype.encode("utf-8") + b"\n")
             match COMPRESSION_FORMAT:
@@ -0,0 +1,267 @@
+"""
+Module for language-level utilities: Rprof-style profiling of the public Ry API
+
+Rprof() swaps every public function exported by RyAPI (and the Ry package) for a timing wrapper,
+and Rprof(False) puts the originals back, so there is no overhead at all while profiling is off.
+Code that bound a function before Rprof() was called (``from Ry import save``) keeps the unwrapped
+original and is not profiled.
+"""
+
+import collections
+import dataclasses
+import functools
+import inspect
+import json
+import os
+import pathlib
+import sys
+import threading
+import time
+import tracemalloc
+import typing
+
+import pandas as pd
+
+from . import IOLayer
+
+__all__ = [ # export funtions for import *
+    "Rprof",
+    "summaryRprof",
+    "write_trace",
+]
+
+TRACE_EVENT_LIMIT = 100_000 # most recent calls kept for write_trace when tracing is on
+
+
+################################################
+#  Byte Accounting for I/O Functions
+################################################
+
+def _size(fp) -> int:
+    """Returns the size of fp on disk, or 0 if it is not an existing path."""
+    if not isinstance(fp, (str, os.PathLike)):
+        return 0
+    try:
+        return os.path.getsize(fp)
+    except OSError:
+        return 0
+
+
+def _saved_size() -> int:
+    # save() records the path it wrote, which covers names it inferred itself
+    return _size(getattr(IOLayer._last_saved, "path", None))
+
+
+def _arg(args, kwargs, pos: int, key: str):
+    return kwargs.get(key, args[pos] if len(args) > pos else None)
+
+
+# function name -> (args, kwargs, result) -> (bytes_read, bytes_written)
+_IO_BYTES: dict[str, typing.Callable[[tuple, dict, typing.Any], tuple[int, int]]] = {
+    "read_csv": lambda args, kwargs, result: (_size(_arg(args, kwargs, 0, "fp")), 0),
+    "read_tsv": lambda args, kwargs, result: (_size(_arg(args, kwargs, 0, "fp")), 0),
+    "read_txt": lambda args, kwargs, result: (_size(_arg(args, kwargs, 0, "fp")), 0),
+    "read_fwf": lambda args, kwargs, result: (_size(_arg(args, kwargs, 0, "fp")), 0),
+    "write_csv": lambda args, kwargs, result: (0, _size(_arg(args, kwargs, 1, "fp"))),
+    "write_txt": lambda args, kwargs, result: (0, _size(_arg(args, kwargs, 1, "fp"))), # fp=None returns a str
+    "save": lambda args, kwargs, result: (0, _saved_size()),
+    "load": lambda args, kwargs, result: (
+        _size(pathlib.Path.cwd() / ".RyData" / _arg(args, kwargs, 0, "name")), 0
+    ),
+}
+
+
+################################################
+#  Recording
+################################################
+
+@dataclasses.dataclass(slots=True)
+class _CallStats:
+    calls: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    peak_bytes: int = 0
+
+
+_stats: dict[str, _CallStats] = collections.defaultdict(_CallStats)
+# (name, start_ns, elapsed_ns, thread id, peak_bytes, bytes_read, bytes_written); tuples keep this small
+_events: collections.deque[tuple] = collections.deque(maxlen=TRACE_EVENT_LIMIT)
+_originals: dict[tuple[str, str], typing.Callable] = {} # (module name, attribute) -> unwrapped function
+_state = threading.local() # per-thread stack of [start_current, child_peak] for nested profiled calls
+_lock = threading.Lock() # guards _stats and _events against concurrent profiled calls
+_memory = False
+_trace = False
+_started_tracemalloc = False
+_epoch_ns = 0
+_pid = os.getpid()
+
+
+def _profiled(func: typing.Callable, name: str) -> typing.Callable:
+    """Wraps func so that each call is timed and, if enabled, its peak allocation measured."""
+    io_bytes = _IO_BYTES.get(name)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        __ry_transparent__ = True # lets save() infer a variable name from the caller's frame, not this one
+        memory = _memory
+        if memory:
+            stack = _state.__dict__.setdefault("stack", [])
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            stack.append([current, 0])
+        ok = False
+        start = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+            ok = True
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            peak = None
+            if memory:
+                base, child_peak = stack.pop()
+                peak_abs = max(tracemalloc.get_traced_memory()[1], child_peak)
+                peak = peak_abs - base
+                if stack: # the reset above hid this call's peak from the caller
+                    stack[-1][1] = max(stack[-1][1], peak_abs)
+            read = written = None
+            if ok and io_bytes is not None:
+                read, written = io_bytes(args, kwargs, result)
+            with _lock:
+                stats = _stats[name]
+                stats.calls += 1
+                stats.total_ns += elapsed
+                if elapsed > stats.max_ns:
+                    stats.max_ns = elapsed
+                if peak is not None:
+                    stats.peak_bytes = max(stats.peak_bytes, peak)
+                if read is not None:
+                    stats.bytes_read += read
+                    stats.bytes_written += written
+                if _trace:
+                    _events.append((name, start, elapsed, threading.get_ident(), peak, read, written))
+        return result
+
+    return wrapper
+
+
+def _namespaces() -> list:
+    """Returns the modules whose public names are instrumented: Ry.RyAPI and the Ry package."""
+    from .. import RyAPI
+    package = sys.modules.get(RyAPI.__name__.rpartition(".")[0])
+    return [RyAPI] if package is None else [RyAPI, package]
+
+
+################################################
+#  Public Interface
+################################################
+
+def _stop_tracemalloc() -> None:
+    """Stops tracemalloc if Rprof started it; tracing the caller started is left alone."""
+    global _started_tracemalloc
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+
+def Rprof(enabled: bool = True, memory: bool = False, trace: bool = False, reset: bool = True) -> None:
+    """
+    Turns profiling of every public Ry function on (default) or off.
+    While on, call counts, wall time, bytes read/written by the I/O functions and (with memory=True)
+    peak tracemalloc allocation are recorded; see summaryRprof().
+    trace=True also keeps the last TRACE_EVENT_LIMIT individual calls for write_trace().
+    memory=True resets tracemalloc's peak on every profiled call, so a peak you track yourself with
+    tracemalloc.get_traced_memory() only covers the time since the latest Ry call.
+    tracemalloc keeps a single process-wide peak, so memory=True peaks are only meaningful when Ry is
+    called from one thread at a time; counts, times and bytes are safe to collect from any thread.
+    reset=True discards data from earlier runs when profiling is switched on
+    """
+
+    global _memory, _trace, _started_tracemalloc, _epoch_ns, _pid
+
+    if not enabled:
+        for (module_name, attr), func in _originals.items():
+            setattr(sys.modules[module_name], attr, func)
+        _originals.clear()
+        _stop_tracemalloc()
+        _memory = _trace = False
+        return
+
+    if reset or not _epoch_ns:
+        with _lock:
+            _stats.clear()
+            _events.clear()
+        _epoch_ns = time.perf_counter_ns()
+        _pid = os.getpid()
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    elif not memory:
+        _stop_tracemalloc()
+    _memory = memory
+    _trace = trace
+
+    namespaces = _namespaces()
+    wrapped: dict[str, typing.Callable] = {}
+    for name in namespaces[0].__all__:
+        if name in __all__:
+            continue
+        for module in namespaces:
+            func = getattr(module, name, None)
+            if (module.__name__, name) in _originals or not inspect.isroutine(func):
+                continue # already wrapped, or a class/other callable that must keep its identity
+            if name not in wrapped:
+                wrapped[name] = _profiled(func, name)
+            _originals[(module.__name__, name)] = func
+            setattr(module, name, wrapped[name])
+
+
+def summaryRprof(by: str = "total_time") -> pd.DataFrame:
+    """
+    Returns a DataFrame with one row per profiled function: calls, total/mean/max time in seconds,
+    bytes read and written, and peak allocation, sorted by the given column (descending)
+    """
+
+    with _lock:
+        snapshot = [(name, dataclasses.replace(s)) for name, s in _stats.items()]
+    rows = {
+        name: {
+            "calls": s.calls,
+            "total_time": s.total_ns / 1e9,
+            "mean_time": s.total_ns / s.calls / 1e9 if s.calls else 0.0,
+            "max_time": s.max_ns / 1e9,
+            "bytes_read": s.bytes_read,
+            "bytes_written": s.bytes_written,
+            "peak_bytes": s.peak_bytes,
+        }
+        for name, s in snapshot
+    }
+    columns = ["calls", "total_time", "mean_time", "max_time", "bytes_read", "bytes_written", "peak_bytes"]
+    summary = pd.DataFrame.from_dict(rows, orient="index", columns=columns)
+    summary.index.name = "function"
+    return summary.sort_values(by, ascending=False)
+
+
+def write_trace(fp: os.PathLike[str] | str) -> None:
+    """
+    Writes the calls recorded with Rprof(trace=True) to fp in Chrome trace-event JSON format
+    (open with chrome://tracing or Perfetto)
+    """
+
+    with _lock:
+        recorded = list(_events)
+    events = []
+    for name, start, elapsed, tid, peak, read, written in recorded:
+        event = {"name": name, "ph": "X", "ts": (start - _epoch_ns) / 1000, "dur": elapsed / 1000,
+                 "pid": _pid, "tid": tid}
+        args = {}
+        if peak is not None:
+            args["peak_bytes"] = peak
+        if read is not None:
+            args.update(bytes_read=read, bytes_written=written)
+        if args:
+            event["args"] = args
+        events.append(event)
+    with open(fp, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,320 @@
+"""
+Module for vectorized string manipulation (paste, grepl, sub/gsub, substr, sprintf, strsplit)
+
+Inputs are normalised to NumPy 2 ``StringDType`` arrays so literal operations run through the
+``np.strings`` ufuncs without creating a Python object per element. Regex operations have no ufunc
+equivalent; they are evaluated once per distinct string and scattered back, so the gain over a plain
+loop grows with how often values repeat (roughly 1.4-2x on the access-log data in benchmarks/).
+Literal grepl is a plain substring search and runs at about the speed of ``[p in s for s in col]``.
+
+Patterns use Python ``re`` syntax rather than R's TRE/PCRE; the POSIX bracket classes R code commonly
+relies on (``[[:digit:]]``, ``[[:space:]]``, ...) are translated to their ASCII ranges.
+"""
+
+import functools
+import re
+import string
+import typing
+
+import numpy as np
+import pandas as pd
+
+__all__ = [ # export funtions for import *
+    "paste",
+    "paste0",
+    "grepl",
+    "sub",
+    "gsub",
+    "substr",
+    "sprintf",
+    "strsplit",
+]
+
+REGEX_CACHE_SIZE = 256 # number of compiled patterns kept by _compile
+
+_STRING_DTYPE = np.dtypes.StringDType()
+_NA_STRING_DTYPE = np.dtypes.StringDType(na_object=np.nan)
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+
+# POSIX class name -> the bracket-expression contents Python's re understands in its place
+_POSIX_CLASSES: dict[str, str] = {
+    "alpha": "a-zA-Z",
+    "digit": "0-9",
+    "alnum": "a-zA-Z0-9",
+    "upper": "A-Z",
+    "lower": "a-z",
+    "space": " \\t\\n\\r\\f\\v",
+    "blank": " \\t",
+    "punct": re.escape(string.punctuation),
+    "xdigit": "0-9A-Fa-f",
+    "cntrl": "\\x00-\\x1f\\x7f",
+    "print": "\\x20-\\x7e",
+    "graph": "\\x21-\\x7e",
+}
+_POSIX_CLASS = re.compile(r"\[:(\w+):\]")
+
+
+################################################
+#  Internal Helpers
+################################################
+
+@functools.lru_cache(maxsize=REGEX_CACHE_SIZE)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compiles a regex, memoised on (pattern, flags) in a bounded LRU cache; POSIX classes are translated first."""
+    if "[:" in pattern:
+        pattern = _POSIX_CLASS.sub(_posix_class, pattern)
+    return re.compile(pattern, flags)
+
+
+def _posix_class(match: re.Match[str]) -> str:
+    try:
+        return _POSIX_CLASSES[match[1]]
+    except KeyError:
+        raise ValueError(f"Unsupported POSIX character class: {match[0]!r}; expected one of {list(_POSIX_CLASSES)}.") from None
+
+
+def _is_literal(pattern: str) -> bool:
+    """True when a regex pattern contains no metacharacters and can be matched as a plain substring."""
+    return not _REGEX_SPECIAL.intersection(pattern)
+
+
+def _as_strings(x) -> tuple[np.ndarray, np.ndarray]:
+    """Converts x to a 1-D StringDType array, returning (values, na_mask)."""
+    if isinstance(x, np.ndarray) and x.dtype == _STRING_DTYPE: # null-free already, no copy needed
+        arr = x.reshape(-1)
+        return arr, np.zeros(arr.shape, dtype=bool)
+    if isinstance(x, pd.Series):
+        arr = x.to_numpy(dtype=_NA_STRING_DTYPE, na_value=np.nan)
+    else:
+        arr = np.asarray(x)
+        if arr.dtype.kind == "O": # None/pd.NA would otherwise be stringified
+            arr = np.where(pd.isna(arr), np.nan, arr)
+        if arr.dtype != _NA_STRING_DTYPE:
+            arr = arr.astype(_NA_STRING_DTYPE)
+    arr = arr.reshape(-1)
+    return arr, np.isnan(arr)
+
+
+def _present(arr: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Returns the non-missing values of arr as a null-free StringDType array (np.strings ufuncs reject nulls)."""
+    if mask.any():
+        return arr[~mask].astype(_STRING_DTYPE)
+    return arr if arr.dtype == _STRING_DTYPE else arr.astype(_STRING_DTYPE)
+
+
+def _fill(values: np.ndarray, mask: np.ndarray, na, dtype) -> np.ndarray:
+    """Scatters per-present-element results back into a full-length array, using na for missing slots."""
+    if not mask.any():
+        return values
+    out = np.empty(mask.shape, dtype=dtype)
+    out[mask] = na
+    out[~mask] = values
+    return out
+
+
+def _map_unique(func: typing.Callable[[str], typing.Any], values: np.ndarray, dtype) -> np.ndarray:
+    """Applies a Python-level func once per distinct string, then broadcasts the results back via the codes."""
+    codes, uniques = pd.factorize(values) # hash-based; np.unique sorts, which is far slower on StringDType
+    mapped = np.array([func(s) for s in uniques.tolist()], dtype=dtype)
+    return mapped[codes]
+
+
+def _recycle(arr: np.ndarray, n: int) -> np.ndarray:
+    """Recycles arr to length n R-style; length-1 inputs become a broadcast view rather than a copy."""
+    if len(arr) == n:
+        return arr
+    if len(arr) == 1:
+        return np.broadcast_to(arr, (n,))
+    return np.resize(arr, n)
+
+
+def _wrap(result: np.ndarray, like):
+    """Returns result as a Series aligned to like if like is a Series of the same length, otherwise as-is."""
+    if isinstance(like, pd.Series) and len(result) == len(like):
+        dtype = like.dtype if isinstance(like.dtype, pd.StringDtype) and result.dtype.kind == "T" else None
+        return pd.Series(result, index=like.index, name=like.name, dtype=dtype)
+    return result
+
+
+def _flags(ignore_case: bool) -> int:
+    return re.IGNORECASE if ignore_case else 0
+
+
+################################################
+#  Concatenation
+################################################
+
+def paste(*args, sep: str = " ", collapse: str | None = None):
+    """
+    Receives any number of vectors, converts them to strings and concatenates them element-wise;
+    shorter vectors are recycled and missing values are written as "NA"
+    """
+
+    parts = []
+    for arg in args:
+        strings, mask = _as_strings(arg)
+        if strings.size == 0: # R drops zero-length vectors
+            continue
+        if mask.any():
+            strings = strings.copy()
+            strings[mask] = "NA"
+        parts.append(strings.astype(_STRING_DTYPE))
+
+    if not parts:
+        return "" if collapse is not None else np.array([], dtype=_STRING_DTYPE)
+
+    n = max(len(p) for p in parts)
+    result = _recycle(parts[0], n)
+    for part in parts[1:]:
+        if sep:
+            result = np.strings.add(result, sep)
+        result = np.strings.add(result, _recycle(part, n))
+
+    if collapse is not None:
+        return collapse.join(result.tolist())
+    return _wrap(result, next((a for a in args if isinstance(a, pd.Series)), None))
+
+
+def paste0(*args, collapse: str | None = None):
+    """
+    Receives any number of vectors, concatenates them element-wise with no separator
+    """
+
+    return paste(*args, sep="", collapse=collapse)
+
+
+################################################
+#  Pattern Matching and Replacement
+################################################
+
+def grepl(pattern: str, x, ignore_case: bool = False, fixed: bool = False):
+    """
+    Receives a pattern and a string vector, returns a boolean vector marking elements that match;
+    missing values never match
+    """
+
+    arr, mask = _as_strings(x)
+    values = _present(arr, mask)
+    if (fixed or _is_literal(pattern)) and not ignore_case:
+        found = np.strings.find(values, pattern) >= 0
+    else:
+        regex = _compile(re.escape(pattern) if fixed else pattern, _flags(ignore_case))
+        found = _map_unique(lambda s: regex.search(s) is not None, values, bool)
+    return _wrap(_fill(found, mask, False, bool), x)
+
+
+def _replace(pattern: str, replacement: str, x, count: int, ignore_case: bool, fixed: bool):
+    """Shared implementation for sub (count=1) and gsub (count=0)."""
+    arr, mask = _as_strings(x)
+    values = _present(arr, mask)
+    literal_ok = fixed or (_is_literal(pattern) and "\\" not in replacement)
+    if literal_ok and not ignore_case:
+        replaced = np.strings.replace(values, pattern, replacement, count if count else -1)
+    else:
+        if fixed: # fixed patterns treat the replacement literally too
+            pattern, replacement = re.escape(pattern), replacement.replace("\\", "\\\\")
+        regex = _compile(pattern, _flags(ignore_case))
+        replaced = _map_unique(lambda s: regex.sub(replacement, s, count=count), values, _STRING_DTYPE)
+    return _wrap(_fill(replaced, mask, np.nan, _NA_STRING_DTYPE), x)
+
+
+def sub(pattern: str, replacement: str, x, ignore_case: bool = False, fixed: bool = False):
+    """
+    Receives a pattern, replacement and string vector, replaces the first match in each element;
+    replacement may use \\1-style group references unless fixed=True
+    """
+
+    return _replace(pattern, replacement, x, 1, ignore_case, fixed)
+
+
+def gsub(pattern: str, replacement: str, x, ignore_case: bool = False, fixed: bool = False):
+    """
+    Receives a pattern, replacement and string vector, replaces every match in each element
+    """
+
+    return _replace(pattern, replacement, x, 0, ignore_case, fixed)
+
+
+################################################
+#  Extraction, Formatting and Splitting
+################################################
+
+def substr(x, start, stop):
+    """
+    Receives a string vector and 1-based inclusive start/stop positions (scalars or vectors),
+    returns the selected substrings
+    """
+
+    arr, mask = _as_strings(x)
+    n = len(arr)
+    start = np.maximum(_recycle(np.asarray(start, dtype=np.intp).reshape(-1), n) - 1, 0)
+    stop = _recycle(np.asarray(stop, dtype=np.intp).reshape(-1), n)
+    stop = np.maximum(stop, start) # stop < start yields an empty string, as in R
+    if mask.any():
+        start, stop = start[~mask], stop[~mask]
+    sliced = np.strings.slice(_present(arr, mask), start, stop)
+    return _wrap(_fill(sliced, mask, np.nan, _NA_STRING_DTYPE), x)
+
+
+def sprintf(fmt: str, *args):
+    """
+    Receives a printf-style format and any number of vectors, returns the formatted strings;
+    fmt and args are recycled to the longest length, and any zero-length argument gives an empty result
+    """
+
+    like = next((a for a in (fmt, *args) if isinstance(a, pd.Series)), None)
+    fmts = np.asarray(fmt.to_numpy() if isinstance(fmt, pd.Series) else fmt, dtype=_STRING_DTYPE).reshape(-1)
+    if not args:
+        return _wrap(fmts, like)
+
+    columns = [np.asarray(a.to_numpy() if isinstance(a, pd.Series) else a).reshape(-1) for a in args]
+    if len(fmts) == 0 or any(len(c) == 0 for c in columns): # R returns character(0); recycling would pad instead
+        return _wrap(np.array([], dtype=_STRING_DTYPE), like)
+    n = max(len(fmts), *(len(c) for c in columns))
+    if len(columns) == 1 and columns[0].dtype.kind != "O":
+        # single argument: np.strings.mod handles the element-wise % without building tuples
+        result = np.strings.mod(_recycle(fmts, n), _recycle(columns[0], n))
+    else:
+        rows = zip(*(_recycle(c, n).tolist() for c in columns))
+        result = np.array([f % row for f, row in zip(_recycle(fmts, n).tolist(), rows)], dtype=_STRING_DTYPE)
+    return _wrap(result.astype(_STRING_DTYPE, copy=False), like)
+
+
+def strsplit(x, split: str, fixed: bool = False) -> list[np.ndarray] | pd.Series:
+    """
+    Receives a string vector and a split pattern, returns a list with one array of pieces per element;
+    an empty split breaks strings into characters. As in R, a trailing empty piece is dropped
+    ("a,b," gives ["a", "b"]), a pattern matching the empty string splits off single characters
+    ("|" splits "a|b" into ["a", "|", "b"]) and an empty string gives no pieces.
+    Returned arrays are read-only and may be shared between equal inputs
+    """
+
+    arr, mask = _as_strings(x)
+    regex = None
+    if split == "":
+        splitter = list
+    elif fixed or _is_literal(split):
+        splitter = lambda s: s.split(split)
+    else:
+        regex = _compile(split)
+        splitter = regex.split
+
+    inverse, uniques = pd.factorize(_present(arr, mask))
+    pieces = []
+    for s in uniques.tolist():
+        parts = splitter(s) if s else []
+        if len(parts) > 1 and parts[-1] == "":
+            parts.pop()
+        if regex is not None and len(parts) > 1 and parts[0] == "" and regex.match(s).end() == 0:
+            parts.pop(0) # re.split reports a zero-width match at 0 as a leading empty piece; R does not
+        piece = np.array(parts, dtype=_STRING_DTYPE)
+        piece.flags.writeable = False
+        pieces.append(piece)
+
+    missing = np.array([np.nan], dtype=_NA_STRING_DTYPE)
+    missing.flags.writeable = False
+    present = iter(inverse.tolist())
+    result = [missing if na else pieces[next(present)] for na in mask.tolist()]
+    if isinstance(x, pd.Series):
+        return pd.Series(result, index=x.index, name=x.name, dtype=object)
+    return result
@@ -0,0 +1,50 @@
+"""
+Runs every benchmark suite. Use --json to keep the results for comparison between releases:
+
+    python -m benchmarks [--json results.json] [suite ...]
+"""
+
+import argparse
+import importlib
+import json
+import platform
+
+import numpy as np
+import pandas as pd
+
+import Ry
+
+from ._common import print_rows
+
+SUITES = ("bench_core", "bench_io", "bench_strings")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("suites", nargs="*", metavar="suite", help=f"one of {', '.join(SUITES)} (default: all)")
+    parser.add_argument("--json", metavar="FILE", help="also write all rows to FILE")
+    options = parser.parse_args()
+    unknown = set(options.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+
+    results = {}
+    for suite in options.suites or SUITES:
+        print(f"== {suite}")
+        module = importlib.import_module(f"benchmarks.{suite}")
+        results[suite] = module.run()
+        print_rows(results[suite])
+
+    if options.json:
+        meta = {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "compression": Ry.Modules.IOLayer.COMPRESSION_FORMAT,
+        }
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Shared helpers for the benchmark suites."""
+
+import timeit
+
+SIZES = (1_000, 100_000, 1_000_000)
+REPEAT = 3
+
+
+def best(stmt, number: int = 1, repeat: int = REPEAT) -> float:
+    """Returns the fastest of repeat runs of stmt, in seconds per call."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+
+
+def print_rows(rows: list[dict]) -> None:
+    print(f"{'case':<26} {'n':>10} {'seconds':>12}")
+    for row in rows:
+        print(f"{row['case']:<26} {row['n']:>10} {row['seconds']:>12.4g}")
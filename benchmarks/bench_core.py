@@ -0,0 +1,39 @@
+"""
+Benchmarks for core.seq and core.rep, plus the per-call overhead of Rprof() instrumentation.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_core
+"""
+
+import Ry
+from Ry import rep, seq
+
+from ._common import SIZES, best, print_rows
+
+
+def run() -> list[dict]:
+    """Returns one row per case and size."""
+    rows = []
+    for n in SIZES:
+        rows.append({"case": "seq", "n": n, "seconds": best(lambda: seq(1, n))})
+        rows.append({"case": "rep scalar", "n": n, "seconds": best(lambda: rep(0, n))})
+        rows.append({"case": "rep list", "n": n, "seconds": best(lambda: rep([1, 2, 3, 4], n // 4))})
+
+    # Overhead of the profiling wrapper on a trivial call, off vs on
+    calls = 100_000
+    for label, enabled in (("rep(1, 3) unprofiled", False), ("rep(1, 3) profiled", True)):
+        Ry.Rprof(enabled)
+        try:
+            rows.append({"case": label, "n": calls, "seconds": best(lambda: Ry.rep(1, 3), number=calls)})
+        finally:
+            Ry.Rprof(False)
+    return rows
+
+
+def main() -> None:
+    print_rows(run())
+
+
+if __name__ == "__main__":
+    main()
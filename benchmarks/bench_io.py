@@ -0,0 +1,72 @@
+"""
+Benchmarks for IOLayer: save/load under each available compression format, read_csv and cat.
+
+Everything is written inside a temporary working directory. Run from the repository root:
+
+    python -m benchmarks.bench_io
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from Ry import cat, load, read_csv, save, write_csv
+from Ry.Modules import IOLayer
+
+from ._common import best, print_rows
+
+# xz-compressed saves and printing a full frame take tens of seconds per run beyond 100k rows
+SIZES = (1_000, 10_000, 100_000)
+
+
+def make_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """Builds an n-row frame mixing numeric and string columns."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "value": rng.normal(size=n),
+        "group": rng.choice(["a", "b", "c", "d"], n),
+    })
+
+
+def run() -> list[dict]:
+    """Returns one row per case and size."""
+    rows = []
+    default_format = IOLayer.COMPRESSION_FORMAT
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            for n in SIZES:
+                frame = make_frame(n)
+                array = frame["value"].to_numpy()
+                for fmt in sorted(IOLayer.SUPPORTED_COMPRESSION_FORMATS):
+                    IOLayer.COMPRESSION_FORMAT = None if fmt == "uncompressed" else fmt
+                    for kind, obj in (("frame", frame), ("ndarray", array)):
+                        name = f"bench_{kind}"
+                        rows.append({"case": f"save {kind} {fmt}", "n": n, "seconds": best(lambda: save(obj, name))})
+                        rows.append({"case": f"load {kind} {fmt}", "n": n, "seconds": best(lambda: load(name))})
+                IOLayer.COMPRESSION_FORMAT = default_format
+
+                write_csv(frame, "bench.csv")
+                rows.append({"case": "read_csv", "n": n, "seconds": best(lambda: read_csv("bench.csv"))})
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    rows.append({"case": "cat frame", "n": n, "seconds": best(lambda: cat(frame))})
+                    rows.append({"case": "cat ndarray", "n": n, "seconds": best(lambda: cat(array))})
+        finally:
+            IOLayer.COMPRESSION_FORMAT = default_format
+            os.chdir(cwd)
+    return rows
+
+
+def main() -> None:
+    print_rows(run())
+
+
+if __name__ == "__main__":
+    main()
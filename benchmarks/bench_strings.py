@@ -0,0 +1,85 @@
+"""
+Benchmarks for Ry's vectorized string kernels against the equivalent per-element Python loops.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_strings
+"""
+
+import re
+
+import numpy as np
+
+from Ry import grepl, gsub, paste, sub, substr
+
+from ._common import SIZES, best
+
+_METHODS = np.array(["GET", "POST", "PUT", "DELETE"])
+_PATHS = np.array(["/api/v1/users", "/api/v1/orders", "/static/app.js", "/healthz", "/login"])
+_STATUS = np.array(["200", "201", "304", "404", "500"])
+
+
+def make_log_lines(n: int, seed: int = 0) -> np.ndarray:
+    """Builds n synthetic access-log lines with realistic repetition."""
+    rng = np.random.default_rng(seed)
+    lines = [
+        f"{m} {p}?id={i} {s}"
+        for m, p, i, s in zip(
+            rng.choice(_METHODS, n),
+            rng.choice(_PATHS, n),
+            rng.integers(0, 500, n),
+            rng.choice(_STATUS, n),
+        )
+    ]
+    return np.array(lines, dtype=np.dtypes.StringDType())
+
+
+def run() -> list[dict]:
+    """Returns one row per case and size, with Ry's time and the equivalent loop's time."""
+    rows = []
+    for n in SIZES:
+        col = make_log_lines(n)
+        cases = {
+            "gsub regex": (
+                lambda: gsub(r"id=\d+", "id=?", col),
+                lambda: [re.sub(r"id=\d+", "id=?", s) for s in col],
+            ),
+            "sub regex": (
+                lambda: sub(r"^(\w+) ", r"\1\t", col),
+                lambda: [re.sub(r"^(\w+) ", r"\1\t", s, count=1) for s in col],
+            ),
+            "gsub literal": (
+                lambda: gsub("/api/v1", "/api/v2", col),
+                lambda: [re.sub("/api/v1", "/api/v2", s) for s in col],
+            ),
+            "grepl regex": (
+                lambda: grepl(r" 5\d\d$", col),
+                lambda: [re.search(r" 5\d\d$", s) is not None for s in col],
+            ),
+            "grepl literal": (
+                lambda: grepl("healthz", col),
+                lambda: ["healthz" in s for s in col],
+            ),
+            "substr": (
+                lambda: substr(col, 1, 4),
+                lambda: [s[0:4] for s in col],
+            ),
+            "paste": (
+                lambda: paste("host", col, sep=":"),
+                lambda: ["host:" + s for s in col],
+            ),
+        }
+        for case, (ry, loop) in cases.items():
+            rows.append({"case": case, "n": n, "seconds": best(ry), "loop_seconds": best(loop)})
+    return rows
+
+
+def main() -> None:
+    print(f"{'case':<14} {'n':>10} {'ry (s)':>10} {'loop (s)':>10} {'speedup':>8}")
+    for row in run():
+        ry, loop = row["seconds"], row["loop_seconds"]
+        print(f"{row['case']:<14} {row['n']:>10} {ry:>10.4f} {loop:>10.4f} {loop / ry:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()